@@ -4,22 +4,51 @@ AC Milan News Aggregator - Scraper
 Aggregates news from multiple sources into a single JSON file.
 """
 
+import asyncio
 import json
 import hashlib
 import re
-from datetime import datetime, timezone
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
 from urllib.parse import urljoin
 
+import aiohttp
 import feedparser
-import requests
+import lxml.html
 from bs4 import BeautifulSoup
-from deep_translator import GoogleTranslator
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Output path
 OUTPUT_PATH = Path(__file__).parent.parent / "data" / "news.json"
 
+# ETag / Last-Modified validators from the previous run, keyed by URL
+HTTP_CACHE_PATH = OUTPUT_PATH.parent / "http_cache.json"
+
+# Newest feed entry link seen by the previous run, keyed by source
+SEEN_LINKS_PATH = OUTPUT_PATH.parent / "seen_links.json"
+
+# Translations persisted between runs, keyed by md5 of the source text
+TRANSLATION_CACHE_PATH = OUTPUT_PATH.parent / "translation_cache.sqlite"
+
 # Request headers to mimic a browser
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -29,27 +58,266 @@ HEADERS = {
 
 REQUEST_TIMEOUT = 30
 
-# Translator instance
-translator = GoogleTranslator(source='it', target='en')
-
-
+# Selectors used to locate article cards and their parts, compiled once
+# Card queries stop at the first 20 matches, as only those are considered
+CARD_SELECTOR = etree.XPath(
+    "(%s)[position() <= 20]"
+    % CSSSelector("article, .news-card, .card, [class*='article'], [class*='news']").path
+)
+CARD_FALLBACK_XPATH = etree.XPath(
+    "(//div[contains(@class, 'card') or contains(@class, 'article') or contains(@class, 'news')])"
+    "[position() <= 20]"
+)
+LINK_XPATH = etree.XPath("(.//a[@href])[1]")
+TITLE_XPATH = etree.XPath(
+    "(.//*[self::h1 or self::h2 or self::h3 or self::h4 or self::span]"
+    "[contains(@class, 'title') or contains(@class, 'heading')])[1]"
+)
+HEADING_XPATH = etree.XPath("(.//*[self::h1 or self::h2 or self::h3 or self::h4])[1]")
+DATE_XPATH = etree.XPath(
+    "(.//*[self::time or self::span][contains(@class, 'date') or contains(@class, 'time')])[1]"
+)
+SUMMARY_XPATH = etree.XPath(
+    "(.//*[self::p or self::div][contains(@class, 'excerpt') or contains(@class, 'summary')"
+    " or contains(@class, 'desc') or contains(@class, 'text')])[1]"
+)
+
+# Translator instances are not thread-safe, so each worker thread gets its own
+translator_local = threading.local()
+
+# Worker threads for blocking translation requests
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Batched translations join texts with a marker Google leaves untouched,
+# staying under the translator's 5000 character request limit
+TRANSLATION_SEPARATOR = "\n@@@\n"
+TRANSLATION_MAX_CHARS = 4500
+
+# Function words that tell English apart from Italian, for skipping texts
+# milannews.it syndicates in English
+ENGLISH_WORDS = frozenset(
+    "the and of to is are was were has have had for with from that this will "
+    "after about their his her they it be by an at on".split()
+)
+ITALIAN_WORDS = frozenset(
+    "il lo la gli le di del della dei delle che e è per con non un una uno "
+    "sono ha al alla nel nella da dal dalla più ma come si".split()
+)
+PUNCTUATION = ".,;:!?\"'()[]«»“”‘’"
+
+TRANSLATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+translation_cache = sqlite3.connect(TRANSLATION_CACHE_PATH, check_same_thread=False)
+translation_cache.execute("CREATE TABLE IF NOT EXISTS tr (k BLOB PRIMARY KEY, v TEXT)")
+translation_cache_lock = threading.Lock()
+
+
+def get_translator() -> "GoogleTranslator":
+    """Return the translator belonging to the current thread.
+
+    deep_translator is imported here so runs served entirely from the
+    translation cache never load it.
+    """
+    if not hasattr(translator_local, "translator"):
+        from deep_translator import GoogleTranslator
+
+        translator_local.translator = GoogleTranslator(source='it', target='en')
+    return translator_local.translator
+
+
+def cache_key(text: str) -> bytes:
+    """Key a text in the translation cache."""
+    return hashlib.md5(text.encode()).digest()
+
+
+def get_cached_translation(text: str) -> Optional[str]:
+    """Look up a previously stored translation."""
+    with translation_cache_lock:
+        row = translation_cache.execute("SELECT v FROM tr WHERE k = ?", (cache_key(text),)).fetchone()
+    return row[0] if row else None
+
+
+def store_translation(text: str, translated: str) -> None:
+    """Remember a translation for later runs."""
+    with translation_cache_lock:
+        translation_cache.execute("INSERT OR REPLACE INTO tr (k, v) VALUES (?, ?)", (cache_key(text), translated))
+
+
+def looks_english(text: str) -> bool:
+    """Guess whether a text is already English by counting common function words."""
+    words = [word.strip(PUNCTUATION) for word in text.lower().split()]
+    english = sum(word in ENGLISH_WORDS for word in words)
+    italian = sum(word in ITALIAN_WORDS for word in words)
+    return english >= 2 and english > 2 * italian
+
+
+def needs_translation(text: str) -> bool:
+    """Check whether a text should be sent to the translator at all."""
+    return bool(text) and len(text.strip()) >= 3 and not looks_english(text)
+
+
+@lru_cache(maxsize=512)
 def translate_text(text: str) -> str:
-    """Translate Italian text to English."""
-    if not text or len(text.strip()) < 3:
+    """Translate Italian text to English.
+
+    Memoised for the run, so recurring phrases skip both the cache and the network.
+    """
+    if not needs_translation(text):
         return text
+
+    cached = get_cached_translation(text)
+    if cached is not None:
+        return cached
+
     try:
-        translated = translator.translate(text)
-        return translated if translated else text
+        translated = get_translator().translate(text)
+        if not translated:
+            return text
+        store_translation(text, translated)
+        return translated
     except Exception as e:
         print(f"    Translation error: {e}")
         return text
 
 
+def translate_chunk(texts: list[str]) -> list[str]:
+    """Translate several texts in a single request, falling back to one call per text."""
+    try:
+        translated = get_translator().translate(TRANSLATION_SEPARATOR.join(texts))
+        parts = [part.strip() for part in (translated or "").split(TRANSLATION_SEPARATOR.strip())]
+        if len(parts) == len(texts) and all(parts):
+            for text, part in zip(texts, parts):
+                store_translation(text, part)
+            return parts
+        print("    Batched translation came back malformed, translating one by one")
+    except Exception as e:
+        print(f"    Batched translation error: {e}")
+
+    return [translate_text(text) for text in texts]
+
+
+async def translate_batch(texts: list[str]) -> list[str]:
+    """Translate a list of Italian texts to English using as few requests as possible.
+
+    Chunks are translated in parallel on worker threads so the event loop keeps
+    serving the other sources meanwhile.
+    """
+    results = list(texts)
+
+    # Texts still to translate, each mapped to every position it appears at
+    pending = {}
+    for i, text in enumerate(texts):
+        if not needs_translation(text):
+            continue
+        if text in pending:
+            pending[text].append(i)
+            continue
+        cached = get_cached_translation(text)
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending[text] = [i]
+
+    # Group texts into chunks that fit within a single request
+    chunks = []
+    chunk = []
+    size = 0
+    for text in pending:
+        cost = len(text) + len(TRANSLATION_SEPARATOR)
+        if chunk and size + cost > TRANSLATION_MAX_CHARS:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(text)
+        size += cost
+    if chunk:
+        chunks.append(chunk)
+
+    loop = asyncio.get_running_loop()
+    translated_chunks = await asyncio.gather(*(
+        loop.run_in_executor(EXECUTOR, translate_chunk, chunk)
+        for chunk in chunks
+    ))
+    for chunk, translated in zip(chunks, translated_chunks):
+        for text, translation in zip(chunk, translated):
+            for i in pending[text]:
+                results[i] = translation
+
+    return results
+
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Union of the numeric date formats, matched once; the named group that
+# participates tells which format the string is in
+DATE_RE = re.compile(
+    r"(?P<iso>\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}(?P<iso_tz>Z|[+-]\d{2}:?[0-5]\d)| \d{2}:\d{2}:\d{2})?)"
+    r"|(?P<dmy>(?P<dmy_day>\d{2})/(?P<dmy_month>\d{2})/(?P<dmy_year>\d{4})"
+    r"(?: (?P<dmy_hour>\d{2}):(?P<dmy_minute>\d{2}))?)"
+    r"|(?P<rss>(?:mon|tue|wed|thu|fri|sat|sun), (?P<rss_day>\d{1,2}) (?P<rss_month>[a-z]{3}) (?P<rss_year>\d{4}) "
+    r"(?P<rss_time>\d{2}:\d{2}:\d{2}) (?P<rss_tz>(?-i:Z)|[+-]\d{2}:?[0-5]\d))",
+    re.ASCII | re.IGNORECASE,
+)
+
+
+def parse_utc_offset(text: str) -> timezone:
+    """Parse a Z, +HHMM or +HH:MM UTC offset."""
+    if text in ("Z", "z"):
+        return timezone.utc
+    text = text.replace(":", "")
+    offset = timedelta(hours=int(text[1:3]), minutes=int(text[3:5]))
+    return timezone(-offset if text[0] == "-" else offset)
+
+
+def match_date(date_str: str) -> Optional[datetime]:
+    """Parse the numeric date formats with a single regex match."""
+    match = DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+
+    if match["iso"]:
+        iso = match["iso"]
+        if match["iso_tz"]:
+            iso = iso[:19]
+        dt = datetime.fromisoformat(iso)
+        if match["iso_tz"]:
+            dt = dt.replace(tzinfo=parse_utc_offset(match["iso_tz"]))
+        return dt
+
+    if match["dmy"]:
+        return datetime(
+            int(match["dmy_year"]), int(match["dmy_month"]), int(match["dmy_day"]),
+            int(match["dmy_hour"] or 0), int(match["dmy_minute"] or 0),
+        )
+
+    time = match["rss_time"]
+    return datetime(
+        int(match["rss_year"]), MONTHS[match["rss_month"].lower()], int(match["rss_day"]),
+        int(time[0:2]), int(time[3:5]), int(time[6:8]),
+        tzinfo=parse_utc_offset(match["rss_tz"]),
+    )
+
+
+@lru_cache(maxsize=1024)
 def parse_date(date_str: str) -> Optional[str]:
     """Parse various date formats to ISO format."""
     if not date_str:
         return None
 
+    date_str = date_str.strip()
+
+    # Numeric formats go through one regex match; strptime is left for the rest
+    try:
+        dt = match_date(date_str)
+    except (KeyError, ValueError):
+        dt = None
+    if dt is not None:
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.isoformat()
+
     # Common date formats to try
     formats = [
         "%Y-%m-%dT%H:%M:%S%z",
@@ -65,8 +333,6 @@ def parse_date(date_str: str) -> Optional[str]:
         "%a, %d %b %Y %H:%M:%S %z",  # RSS format: Sat, 31 Jan 2026 14:12:02 +0100
     ]
 
-    date_str = date_str.strip()
-
     for fmt in formats:
         try:
             dt = datetime.strptime(date_str, fmt)
@@ -105,44 +371,190 @@ def parse_feedparser_date(entry) -> Optional[str]:
     return None
 
 
+def find_first(xpath: etree.XPath, element) -> Optional[lxml.html.HtmlElement]:
+    """Return the first element matched by a compiled XPath, if any."""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def html_to_text(html: str) -> str:
+    """Extract the text of an HTML fragment in a single pass over the tree.
+
+    Images and other void elements carry no text, so they need no removing first.
+    Uses selectolax's C parser when installed, BeautifulSoup otherwise.
+    """
+    if LexborHTMLParser is not None:
+        body = LexborHTMLParser(html).body
+        return body.text().strip() if body is not None else ""
+    return BeautifulSoup(html, "html.parser").get_text().strip()
+
+
 def generate_id(url: str) -> str:
     """Generate a unique ID for an article based on its URL."""
-    return hashlib.md5(url.encode()).hexdigest()[:12]
+    return hashlib.blake2b(url.encode(), digest_size=6).hexdigest()
+
+
+def load_json(path: Path, default):
+    """Load a JSON file, returning a default if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return default
+
+
+http_cache = load_json(HTTP_CACHE_PATH, {})
+seen_links = load_json(SEEN_LINKS_PATH, {})
+previous_output = load_json(OUTPUT_PATH, {})
+
+
+def load_previous_articles(source: str) -> list[dict]:
+    """Return the articles a source contributed to the previous news.json."""
+    return [
+        {key: value for key, value in article.items() if key != "id"}
+        for article in previous_output.get("articles", [])
+        if article.get("source") == source
+    ]
+
+
+def split_new_entries(
+    source: str,
+    entries: list,
+    previous: list[dict],
+    reusable: Optional[Callable[[object], bool]] = None,
+) -> tuple[list, list[dict]]:
+    """Split feed entries at the newest link seen on the previous run.
+
+    Returns the entries that need processing, and the previous articles for the
+    remaining entries, which can be reused as they are. Entries below the cut
+    with no previous article, such as backdated posts, are processed too, as are
+    entries the optional reusable check rejects.
+    """
+    newest_link = seen_links.get(source)
+    if entries:
+        seen_links[source] = entries[0].link
+
+    previous_by_url = {article["url"]: article for article in previous}
+    for i, entry in enumerate(entries):
+        if entry.link == newest_link:
+            new_entries = entries[:i]
+            reused = []
+            for e in entries[i:]:
+                if e.link in previous_by_url and (reusable is None or reusable(e)):
+                    reused.append(previous_by_url[e.link])
+                else:
+                    new_entries.append(e)
+            if reused:
+                return new_entries, reused
+            break
+
+    return entries, []
+
+
+def milannews_summary(entry) -> str:
+    """Return the Italian summary text of a milannews.it entry."""
+    if hasattr(entry, "summary"):
+        return html_to_text(entry.summary)[:300]
+    return ""
+
+
+def has_cached_translation(entry) -> bool:
+    """Check that an entry's title and summary were translated, rather than left in Italian after an error."""
+    for text in (entry.title.strip(), milannews_summary(entry)):
+        if needs_translation(text) and get_cached_translation(text) is None:
+            return False
+    return True
+
+
+def save_json(path: Path, data) -> None:
+    """Write state kept between runs to a JSON file."""
+    path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+
+
+class Download(NamedTuple):
+    """A downloaded response body and the validators to store once it is processed."""
+
+    body: bytes
+    encoding: str
+    validators: dict
+
+
+async def fetch_url(session: aiohttp.ClientSession, url: str, conditional: bool = False) -> Optional[Download]:
+    """Download a URL and return the raw response body with its validators.
+
+    With conditional set, the validators stored for the URL are sent along and
+    None is returned if the server answers 304 Not Modified. The caller records
+    the new validators in http_cache only after processing the body successfully.
+    """
+    headers = {}
+    validators = http_cache.get(url, {})
+    if conditional and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if conditional and validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            return None
+        response.raise_for_status()
+        body = await response.read()
+        encoding = response.get_encoding()
+
+    return Download(body, encoding, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    })
 
 
-def fetch_milannews_rss() -> list[dict]:
-    """Fetch articles from milannews.it RSS feed."""
+async def fetch_milannews_rss(session: aiohttp.ClientSession) -> list[dict]:
+    """Fetch articles from milannews.it RSS feed.
+
+    If any translation fails, the feed's validators are dropped, so the next run
+    downloads it again instead of republishing the Italian text on a 304.
+    """
     articles = []
     url = "https://www.milannews.it/rss"
 
     print(f"Fetching RSS from {url}...")
 
     try:
-        feed = feedparser.parse(url)
-
-        for entry in feed.entries[:20]:
-            # Get original Italian title and summary
-            title_it = entry.title.strip()
-            summary_it = ""
-            if hasattr(entry, "summary"):
-                soup = BeautifulSoup(entry.summary, "html.parser")
-                summary_it = soup.get_text().strip()[:300]
-
-            # Translate to English
-            title_en = translate_text(title_it)
-            summary_en = translate_text(summary_it) if summary_it else ""
-
+        previous = load_previous_articles("milannews.it")
+        download = await fetch_url(session, url, conditional=bool(previous))
+        if download is None:
+            print(f"  milannews.it unchanged, reusing {len(previous)} articles")
+            return previous
+
+        feed = feedparser.parse(download.body)
+
+        # Articles whose translation failed last run are redone rather than reused
+        entries, reused = split_new_entries(
+            "milannews.it", feed.entries[:20], previous, reusable=has_cached_translation
+        )
+
+        # Collect original Italian titles and summaries, translated together below
+        to_translate = []
+        for entry in entries:
             article = {
-                "id": generate_id(entry.link),
-                "title": title_en,
+                "title": entry.title.strip(),
                 "url": entry.link,
                 "source": "milannews.it",
                 "date": parse_feedparser_date(entry),
-                "summary": summary_en,
+                "summary": milannews_summary(entry),
             }
 
+            to_translate.extend([article["title"], article["summary"]])
             articles.append(article)
 
+        # Translate to English
+        translated = await translate_batch(to_translate)
+        for i, article in enumerate(articles):
+            article["title"] = translated[2 * i]
+            article["summary"] = translated[2 * i + 1]
+
+        articles.extend(reused)
+        if all(not needs_translation(text) or get_cached_translation(text) is not None for text in to_translate):
+            http_cache[url] = download.validators
+        else:
+            http_cache.pop(url, None)
         print(f"  Found {len(articles)} articles from milannews.it (translated to English)")
 
     except Exception as e:
@@ -151,7 +563,7 @@ def fetch_milannews_rss() -> list[dict]:
     return articles
 
 
-def fetch_football_italia() -> list[dict]:
+async def fetch_football_italia(session: aiohttp.ClientSession) -> list[dict]:
     """Fetch articles from football-italia.net Milan RSS feed."""
     articles = []
     url = "https://football-italia.net/category/teams/milan/feed/"
@@ -159,17 +571,23 @@ def fetch_football_italia() -> list[dict]:
     print(f"Fetching RSS from {url}...")
 
     try:
-        feed = feedparser.parse(url)
+        previous = load_previous_articles("football-italia.net")
+        download = await fetch_url(session, url, conditional=bool(previous))
+        if download is None:
+            print(f"  football-italia.net unchanged, reusing {len(previous)} articles")
+            return previous
+
+        feed = feedparser.parse(download.body)
 
-        for entry in feed.entries[:20]:
+        entries, reused = split_new_entries("football-italia.net", feed.entries[:20], previous)
+
+        for entry in entries:
             # Get summary from description
             summary = ""
             if hasattr(entry, "description"):
-                soup = BeautifulSoup(entry.description, "html.parser")
-                summary = soup.get_text().strip()[:300]
+                summary = html_to_text(entry.description)[:300]
 
             article = {
-                "id": generate_id(entry.link),
                 "title": entry.title.strip(),
                 "url": entry.link,
                 "source": "football-italia.net",
@@ -179,6 +597,8 @@ def fetch_football_italia() -> list[dict]:
 
             articles.append(article)
 
+        articles.extend(reused)
+        http_cache[url] = download.validators
         print(f"  Found {len(articles)} articles from football-italia.net")
 
     except Exception as e:
@@ -187,7 +607,7 @@ def fetch_football_italia() -> list[dict]:
     return articles
 
 
-def fetch_sempremilan() -> list[dict]:
+async def fetch_sempremilan(session: aiohttp.ClientSession) -> list[dict]:
     """Fetch articles from sempremilan.com RSS feed."""
     articles = []
     url = "https://sempremilan.com/feed"
@@ -195,17 +615,21 @@ def fetch_sempremilan() -> list[dict]:
     print(f"Fetching RSS from {url}...")
 
     try:
-        feed = feedparser.parse(url)
+        previous = load_previous_articles("sempremilan.com")
+        download = await fetch_url(session, url, conditional=bool(previous))
+        if download is None:
+            print(f"  sempremilan.com unchanged, reusing {len(previous)} articles")
+            return previous
+
+        feed = feedparser.parse(download.body)
 
-        for entry in feed.entries[:20]:
+        entries, reused = split_new_entries("sempremilan.com", feed.entries[:20], previous)
+
+        for entry in entries:
             # Get summary - clean HTML from description
             summary = ""
             if hasattr(entry, "description"):
-                soup = BeautifulSoup(entry.description, "html.parser")
-                # Remove images and get text
-                for img in soup.find_all("img"):
-                    img.decompose()
-                text = soup.get_text().strip()
+                text = html_to_text(entry.description)
                 # Clean up "By: Author" prefix if present
                 if text.startswith("By:"):
                     lines = text.split("\n", 1)
@@ -213,7 +637,6 @@ def fetch_sempremilan() -> list[dict]:
                 summary = text[:300]
 
             article = {
-                "id": generate_id(entry.link),
                 "title": entry.title.strip(),
                 "url": entry.link,
                 "source": "sempremilan.com",
@@ -223,6 +646,8 @@ def fetch_sempremilan() -> list[dict]:
 
             articles.append(article)
 
+        articles.extend(reused)
+        http_cache[url] = download.validators
         print(f"  Found {len(articles)} articles from sempremilan.com")
 
     except Exception as e:
@@ -231,7 +656,7 @@ def fetch_sempremilan() -> list[dict]:
     return articles
 
 
-def fetch_acmilan_official() -> list[dict]:
+async def fetch_acmilan_official(session: aiohttp.ClientSession) -> list[dict]:
     """Scrape articles from official AC Milan website."""
     articles = []
     url = "https://www.acmilan.com/en/news/articles/latest"
@@ -239,21 +664,27 @@ def fetch_acmilan_official() -> list[dict]:
     print(f"Scraping {url}...")
 
     try:
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        previous = load_previous_articles("acmilan.com")
+        download = await fetch_url(session, url, conditional=bool(previous))
+        if download is None:
+            print(f"  acmilan.com unchanged, reusing {len(previous)} articles")
+            return previous
 
-        soup = BeautifulSoup(response.content, "lxml")
+        # Decode with the charset from the response, as libxml2 would assume
+        # Latin-1 for pages without a <meta charset>
+        parser = lxml.html.HTMLParser(encoding=download.encoding)
+        root = lxml.html.fromstring(download.body, parser=parser)
 
         # Find article cards - AC Milan uses various card structures
-        article_cards = soup.select("article, .news-card, .card, [class*='article'], [class*='news']")
+        article_cards = CARD_SELECTOR(root)
 
         if not article_cards:
-            article_cards = soup.find_all("div", class_=re.compile(r"card|article|news"))
+            article_cards = CARD_FALLBACK_XPATH(root)
 
-        for card in article_cards[:20]:
+        for card in article_cards:
             # Find link and title
-            link_elem = card.find("a", href=True)
-            if not link_elem:
+            link_elem = find_first(LINK_XPATH, card)
+            if link_elem is None:
                 continue
 
             href = link_elem.get("href", "")
@@ -267,20 +698,19 @@ def fetch_acmilan_official() -> list[dict]:
                 continue
 
             # Get title
-            title_elem = card.find(["h1", "h2", "h3", "h4", "span"], class_=re.compile(r"title|heading"))
-            if not title_elem:
-                title_elem = card.find(["h1", "h2", "h3", "h4"])
+            title_elem = find_first(TITLE_XPATH, card)
+            if title_elem is None:
+                title_elem = find_first(HEADING_XPATH, card)
 
-            if title_elem:
-                title = title_elem.get_text().strip()
+            if title_elem is not None:
+                title = title_elem.text_content().strip()
             else:
-                title = link_elem.get_text().strip()
+                title = link_elem.text_content().strip()
 
             if not title or len(title) < 10:
                 continue
 
             article = {
-                "id": generate_id(article_url),
                 "title": title,
                 "url": article_url,
                 "source": "acmilan.com",
@@ -289,18 +719,19 @@ def fetch_acmilan_official() -> list[dict]:
             }
 
             # Try to find date
-            date_elem = card.find(["time", "span"], class_=re.compile(r"date|time"))
-            if date_elem:
-                date_text = date_elem.get("datetime") or date_elem.get_text()
+            date_elem = find_first(DATE_XPATH, card)
+            if date_elem is not None:
+                date_text = date_elem.get("datetime") or date_elem.text_content()
                 article["date"] = parse_date(date_text)
 
             # Try to find summary
-            summary_elem = card.find(["p", "div"], class_=re.compile(r"excerpt|summary|desc|text"))
-            if summary_elem:
-                article["summary"] = summary_elem.get_text().strip()[:300]
+            summary_elem = find_first(SUMMARY_XPATH, card)
+            if summary_elem is not None:
+                article["summary"] = summary_elem.text_content().strip()[:300]
 
             articles.append(article)
 
+        http_cache[url] = download.validators
         print(f"  Found {len(articles)} articles from acmilan.com")
 
     except Exception as e:
@@ -311,12 +742,12 @@ def fetch_acmilan_official() -> list[dict]:
 
 def deduplicate_articles(articles: list[dict]) -> list[dict]:
     """Remove duplicate articles based on URL."""
-    seen_ids = set()
+    seen_urls = set()
     unique_articles = []
 
     for article in articles:
-        if article["id"] not in seen_ids:
-            seen_ids.add(article["id"])
+        if article["url"] not in seen_urls:
+            seen_urls.add(article["url"])
             unique_articles.append(article)
 
     return unique_articles
@@ -324,12 +755,27 @@ def deduplicate_articles(articles: list[dict]) -> list[dict]:
 
 def sort_articles(articles: list[dict]) -> list[dict]:
     """Sort articles by date (newest first), with undated articles at the end."""
-    def sort_key(article):
-        if article["date"]:
-            return (0, article["date"])
-        return (1, "")
+    dated = [article for article in articles if article["date"]]
+    undated = [article for article in articles if not article["date"]]
+    # Compare instants rather than strings, so differing UTC offsets sort correctly;
+    # sort() computes each key once, so nothing needs caching on the articles
+    dated.sort(key=lambda article: datetime.fromisoformat(article["date"]).timestamp(), reverse=True)
+    return dated + undated
 
-    return sorted(articles, key=sort_key, reverse=True)
+
+async def fetch_all_sources() -> list[dict]:
+    """Fetch all sources concurrently over a shared, keep-alive connection pool."""
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS, timeout=timeout) as session:
+        results = await asyncio.gather(
+            fetch_milannews_rss(session),
+            fetch_football_italia(session),
+            fetch_sempremilan(session),
+            fetch_acmilan_official(session),
+        )
+
+    return [article for articles in results for article in articles]
 
 
 def main():
@@ -339,13 +785,9 @@ def main():
     print("=" * 50)
     print()
 
-    all_articles = []
-
     # Fetch from all sources
-    all_articles.extend(fetch_milannews_rss())
-    all_articles.extend(fetch_football_italia())
-    all_articles.extend(fetch_sempremilan())
-    all_articles.extend(fetch_acmilan_official())
+    all_articles = asyncio.run(fetch_all_sources())
+    translation_cache.commit()
 
     print()
     print(f"Total articles fetched: {len(all_articles)}")
@@ -357,18 +799,25 @@ def main():
     # Sort by date
     sorted_articles = sort_articles(unique_articles)
 
-    # Create output data
+    # Create output data, adding IDs for consumers of news.json
     output = {
         "lastUpdated": datetime.now(timezone.utc).isoformat(),
-        "articles": sorted_articles,
+        "articles": [{"id": generate_id(article["url"]), **article} for article in sorted_articles],
     }
 
     # Ensure output directory exists
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to file
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        OUTPUT_PATH.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+
+    # Only persist run state once news.json holds the articles it refers to
+    save_json(HTTP_CACHE_PATH, http_cache)
+    save_json(SEEN_LINKS_PATH, seen_links)
 
     print()
     print(f"Saved {len(sorted_articles)} articles to {OUTPUT_PATH}")